@@ -1,11 +1,17 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, make_response, render_template, stream_with_context
 from flask_cors import CORS
 import os
+import json
 import uuid
 from datetime import datetime
+from functools import wraps
 from utils.extractors import TextExtractor
 from utils.validators import InputValidator
 from utils.file_processors import FileProcessor
+from utils.result_index import ResultIndex, CATEGORIES
+from utils.entity_index import EntityIndex
+from utils.admission import AdmissionController, BudgetExceeded, Overloaded, ResourceBudget
+from utils.profiling import RequestProfiler
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24)
@@ -15,10 +21,86 @@ CORS(app)
 # In-memory session storage (for production, use Redis or database)
 sessions = {}
 
+# Admission control: concurrent requests per endpoint class, and per-request budgets
+app.config['ADMISSION_LIMITS'] = {'text': 8, 'file': 2}
+app.config['ADMISSION_RETRY_AFTER'] = {'text': 1, 'file': 5}
+# Upload memory budgets charge the raw upload (or the uncompressed size of DOCX/XLSX
+# parts) plus the text extracted from it. Text input is already capped at 1MB by
+# InputValidator, so it only gets a CPU budget
+app.config['REQUEST_BUDGETS'] = {
+    'text': {'cpu_seconds': 10},
+    'file': {'cpu_seconds': 30, 'memory_bytes': 64 * 1024 * 1024}
+}
+
+# Default and maximum page sizes for the results query API
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
 # Initialize utilities
 extractor = TextExtractor()
 validator = InputValidator()
 file_processor = FileProcessor()
+admission = AdmissionController(app.config['ADMISSION_LIMITS'], app.config['ADMISSION_RETRY_AFTER'])
+
+# Per-request profiling is only available when an admin token is configured
+profiler = RequestProfiler(os.environ.get('PATTERNHIVE_ADMIN_TOKEN'))
+
+# Persistent cross-document entity index (SQLite)
+os.makedirs(app.instance_path, exist_ok=True)
+entity_index = EntityIndex(
+    os.environ.get('PATTERNHIVE_ENTITY_DB', os.path.join(app.instance_path, 'entities.db'))
+)
+
+def _overloaded_response(error):
+    """503 telling the client when to retry a shed request"""
+    response = jsonify({'error': str(error), 'budget': 'concurrency'})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def _budget_response(error):
+    """422 reporting which per-request budget was exceeded"""
+    return jsonify({
+        'error': str(error),
+        'budget': error.budget,
+        'limit': error.limit,
+        'used': error.used
+    }), 422
+
+def admitted(endpoint_class):
+    """Run a view under its endpoint class's concurrency limit and resource budget"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                with admission.admit(endpoint_class), \
+                        ResourceBudget(**app.config['REQUEST_BUDGETS'][endpoint_class]):
+                    return view(*args, **kwargs)
+            except Overloaded as e:
+                return _overloaded_response(e)
+            except BudgetExceeded as e:
+                return _budget_response(e)
+        return wrapper
+    return decorator
+
+def profiled(endpoint):
+    """Profile a view when an admin sends X-Profile with a valid X-Admin-Token"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not (profiler.enabled and request.headers.get('X-Profile')
+                    and profiler.is_admin(request.headers.get('X-Admin-Token'))):
+                return view(*args, **kwargs)
+            
+            with profiler.capture(endpoint) as profile_id:
+                response = make_response(view(*args, **kwargs))
+            if profile_id:
+                response.headers['X-Profile-Id'] = profile_id
+            else:
+                response.headers['X-Profile-Skipped'] = 'Another request is being profiled'
+            return response
+        return wrapper
+    return decorator
 
 @app.route('/')
 def index():
@@ -31,6 +113,8 @@ def results():
     return render_template('results.html')
 
 @app.route('/api/extract', methods=['POST'])
+@profiled('extract')
+@admitted('text')
 def extract_data():
     """Extract emails, phones, and names from text input"""
     try:
@@ -50,25 +134,28 @@ def extract_data():
         
         # Store results in session for export
         session_id = str(uuid.uuid4())
+        index = ResultIndex(results)
         sessions[session_id] = {
             'results': results,
+            'index': index,
             'timestamp': datetime.now().isoformat()
         }
+        entity_index.add_document(session_id, results)
         
         return jsonify({
             'session_id': session_id,
-            'results': results,
-            'stats': {
-                'emails_found': len(results['emails']),
-                'phones_found': len(results['phones']),
-                'names_found': len(results['names'])
-            }
+            'stats': index.stats(),
+            'page': index.query(limit=DEFAULT_PAGE_SIZE)
         })
         
+    except BudgetExceeded:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/upload', methods=['POST'])
+@profiled('upload')
+@admitted('file')
 def upload_file():
     """Process uploaded file and extract data"""
     try:
@@ -95,26 +182,236 @@ def upload_file():
         
         # Store results in session
         session_id = str(uuid.uuid4())
+        index = ResultIndex(results)
         sessions[session_id] = {
             'results': results,
+            'index': index,
             'filename': file.filename,
             'timestamp': datetime.now().isoformat()
         }
+        entity_index.add_document(session_id, results, source=file.filename)
         
         return jsonify({
             'session_id': session_id,
             'filename': file.filename,
-            'results': results,
-            'stats': {
-                'emails_found': len(results['emails']),
-                'phones_found': len(results['phones']),
-                'names_found': len(results['names'])
+            'stats': index.stats(),
+            'page': index.query(limit=DEFAULT_PAGE_SIZE)
+        })
+        
+    except BudgetExceeded:
+        raise
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/upload/stream', methods=['POST'])
+def upload_file_stream():
+    """Process uploaded file, streaming results per page as Server-Sent Events"""
+    # Take the slot before request.files parses the multipart body, so shed
+    # requests never spool their upload. It is held until the stream closes.
+    try:
+        admission.try_acquire('file')
+    except Overloaded as e:
+        return _overloaded_response(e)
+    
+    streaming = False
+    try:
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file uploaded'}), 400
+        
+        file = request.files['file']
+        
+        if file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        # Validate file
+        if not validator.validate_file(file):
+            return jsonify({'error': 'Invalid file type'}), 400
+        
+        response = _stream_upload(file)
+        response.call_on_close(lambda: admission.release('file'))
+        streaming = True
+        return response
+    finally:
+        if not streaming:
+            admission.release('file')
+
+def _stream_upload(file):
+    """Build the SSE response that extracts an uploaded file chunk by chunk"""
+    def generate():
+        results = {'emails': [], 'phones': [], 'names': []}
+        seen = {}
+        found_text = False
+        
+        try:
+            with ResourceBudget(**app.config['REQUEST_BUDGETS']['file']):
+                for text, chunk, total in file_processor.iter_chunks(file):
+                    found_text = found_text or bool(text.strip())
+                    new_results = extractor.extract_new(text, seen)
+                    for data_type, items in new_results.items():
+                        results[data_type].extend(items)
+                    
+                    yield _sse_event('progress', {
+                        'chunk': chunk,
+                        'total_chunks': total,
+                        'percent': round(chunk * 100 / total),
+                        'results': new_results
+                    })
+            
+            if not found_text:
+                yield _sse_event('error', {'error': 'Could not extract text from file'})
+                return
+            
+            # Match the ordering of a non-streamed extraction
+            results['names'].sort(key=lambda x: x['confidence'], reverse=True)
+            
+            # Store results in session
+            session_id = str(uuid.uuid4())
+            index = ResultIndex(results)
+            sessions[session_id] = {
+                'results': results,
+                'index': index,
+                'filename': file.filename,
+                'timestamp': datetime.now().isoformat()
             }
+            entity_index.add_document(session_id, results, source=file.filename)
+            
+            yield _sse_event('complete', {
+                'session_id': session_id,
+                'filename': file.filename,
+                'stats': index.stats(),
+                'page': index.query(limit=DEFAULT_PAGE_SIZE)
+            })
+            
+        except BudgetExceeded as e:
+            yield _sse_event('error', {
+                'error': str(e),
+                'budget': e.budget,
+                'limit': e.limit,
+                'used': e.used
+            })
+        except Exception as e:
+            yield _sse_event('error', {'error': str(e)})
+    
+    return Response(stream_with_context(generate()), 200, {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+def _sse_event(event, data):
+    """Format a Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.route('/api/results/<session_id>')
+def query_results(session_id):
+    """Page through a session's results with optional filters"""
+    try:
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 404
+        
+        try:
+            filters, cursor, limit = _parse_result_query(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        index = sessions[session_id]['index']
+        return jsonify({
+            'session_id': session_id,
+            'stats': index.stats(),
+            'page': index.query(filters, cursor, limit)
         })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _parse_result_query(args):
+    """Parse filter, cursor and limit query parameters for the results API"""
+    filters = {}
+    
+    category = args.get('type')
+    if category:
+        if category not in CATEGORIES:
+            raise ValueError(f"Invalid type filter. Use one of: {', '.join(CATEGORIES)}")
+        filters['category'] = category
+    
+    for field in ('domain', 'country'):
+        if args.get(field):
+            filters[field] = args[field]
+    
+    valid = args.get('valid')
+    if valid:
+        if valid.lower() not in ('true', 'false'):
+            raise ValueError('Invalid valid filter. Use true or false')
+        filters['valid'] = valid.lower() == 'true'
+    
+    if args.get('min_confidence'):
+        try:
+            min_confidence = float(args['min_confidence'])
+        except ValueError:
+            raise ValueError('Invalid min_confidence filter')
+        # float() accepts 'nan' and 'inf'; confidence scores lie in [0, 1]
+        if not 0 <= min_confidence <= 1:
+            raise ValueError('Invalid min_confidence filter')
+        filters['min_confidence'] = min_confidence
+    
+    cursor = None
+    if args.get('cursor'):
+        try:
+            cursor = int(args['cursor'])
+        except ValueError:
+            raise ValueError('Invalid cursor')
+    
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError('Invalid limit')
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    
+    return filters, cursor, limit
+
+@app.route('/api/entities/lookup')
+def lookup_entity():
+    """Find every document that mentions an email, phone or name"""
+    try:
+        kind = request.args.get('type')
+        value = request.args.get('value')
+        
+        if kind not in CATEGORIES or not value:
+            return jsonify({'error': f"Provide a value and a type ({', '.join(CATEGORIES)})"}), 400
+        
+        entity = entity_index.lookup(kind, value, request.args.get('country'))
+        if entity is None:
+            return jsonify({'error': 'Entity not found'}), 404
+        
+        return jsonify(entity)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/entities/export/<format_type>')
+def export_entities(format_type):
+    """Stream a deduplicated export of every entity across all documents"""
+    try:
+        kind = request.args.get('type')
+        if kind and kind not in CATEGORIES:
+            return jsonify({'error': 'Invalid type filter'}), 400
+        
+        if format_type == 'json':
+            return Response(entity_index.export_json(kind), 200, {
+                'Content-Type': 'application/json',
+                'Content-Disposition': 'attachment; filename=entities.json'
+            })
+        elif format_type == 'csv':
+            return Response(entity_index.export_csv(kind), 200, {
+                'Content-Type': 'text/csv',
+                'Content-Disposition': 'attachment; filename=entities.csv'
+            })
+        else:
+            return jsonify({'error': 'Invalid export format'}), 400
+            
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/export/<format_type>/<session_id>')
 def export_data(format_type, session_id):
     """Export extracted data in specified format"""
@@ -124,8 +421,14 @@ def export_data(format_type, session_id):
         
         results = sessions[session_id]['results']
         
+        # Optionally restrict the export to a single data type
+        category = request.args.get('type')
+        if category:
+            if category not in CATEGORIES:
+                return jsonify({'error': 'Invalid type filter'}), 400
+            results = {key: (results[key] if key == category else []) for key in CATEGORIES}
+        
         if format_type == 'json':
-            import json
             json_data = json.dumps(results, indent=2)
             return json_data, 200, {
                 'Content-Type': 'application/json',
@@ -149,6 +452,41 @@ def export_data(format_type, session_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/profiles')
+def list_profiles():
+    """List stored request profiles (admin only)"""
+    if not profiler.enabled:
+        return jsonify({'error': 'Endpoint not found'}), 404
+    if not profiler.is_admin(request.headers.get('X-Admin-Token')):
+        return jsonify({'error': 'Admin token required'}), 403
+    
+    return jsonify({'profiles': profiler.list_profiles()})
+
+@app.route('/api/profiles/<profile_id>/<artifact>')
+def download_profile(profile_id, artifact):
+    """Download a stored profile's pstats dump or allocation report (admin only)"""
+    if not profiler.enabled:
+        return jsonify({'error': 'Endpoint not found'}), 404
+    if not profiler.is_admin(request.headers.get('X-Admin-Token')):
+        return jsonify({'error': 'Admin token required'}), 403
+    
+    profile = profiler.get(profile_id)
+    if profile is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    
+    if artifact == 'pstats':
+        return profile['pstats'], 200, {
+            'Content-Type': 'application/octet-stream',
+            'Content-Disposition': f'attachment; filename=profile_{profile_id}.pstats'
+        }
+    elif artifact == 'allocations':
+        return profile['allocations'], 200, {
+            'Content-Type': 'text/plain',
+            'Content-Disposition': f'attachment; filename=allocations_{profile_id}.txt'
+        }
+    else:
+        return jsonify({'error': 'Invalid profile artifact'}), 400
+
 @app.errorhandler(413)
 def file_too_large(error):
     return jsonify({'error': 'File too large. Maximum size is 16MB.'}), 413
@@ -202,10 +202,10 @@ class PatternHive {
             }
             
             this.currentSession = data.session_id;
-            this.currentResults = data.results;
+            this.currentResults = data.page;
             
             // Cache results for the results page
-            this.cacheResults(data.session_id, data.results, data.stats);
+            this.cacheResults(data.session_id, data.page, data.stats);
             
             // Redirect to results page
             this.redirectToResults(data.session_id);
@@ -260,26 +260,38 @@ class PatternHive {
             const formData = new FormData();
             formData.append('file', file);
             
-            const response = await fetch('/api/upload', {
+            // Stream results back page by page as Server-Sent Events
+            const response = await fetch('/api/upload/stream', {
                 method: 'POST',
                 body: formData
             });
             
             if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
+                // Validation and load-shedding errors arrive as plain JSON
+                const error = await response.json().catch(() => ({}));
+                throw new Error(error.error || `HTTP error! status: ${response.status}`);
             }
             
-            const data = await response.json();
+            let data = null;
+            await this.readEventStream(response, (event, payload) => {
+                if (event === 'progress') {
+                    this.updateUploadProgress(payload.percent);
+                } else if (event === 'complete') {
+                    data = payload;
+                } else if (event === 'error') {
+                    throw new Error(payload.error);
+                }
+            });
             
-            if (data.error) {
-                throw new Error(data.error);
+            if (!data) {
+                throw new Error('Upload ended before results were ready');
             }
             
             this.currentSession = data.session_id;
-            this.currentResults = data.results;
+            this.currentResults = data.page;
             
             // Cache results for the results page
-            this.cacheResults(data.session_id, data.results, data.stats, data.filename);
+            this.cacheResults(data.session_id, data.page, data.stats, data.filename);
             
             // Redirect to results page
             this.redirectToResults(data.session_id);
@@ -338,18 +350,37 @@ class PatternHive {
     showUploadProgress() {
         this.elements.uploadProgress.classList.remove('hidden');
         this.elements.progressFill.style.width = '0%';
+    }
+    
+    updateUploadProgress(percent) {
+        // Driven by the server's per-page progress events
+        this.elements.progressFill.style.width = percent + '%';
+    }
+    
+    async readEventStream(response, onEvent) {
+        // Read a text/event-stream response, calling onEvent(event, data) per event
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
         
-        // Simulate progress
-        let progress = 0;
-        const interval = setInterval(() => {
-            progress += Math.random() * 30;
-            if (progress > 90) progress = 90;
-            this.elements.progressFill.style.width = progress + '%';
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            
+            buffer += decoder.decode(value, { stream: true });
+            const events = buffer.split('\n\n');
+            buffer = events.pop();
             
-            if (progress >= 90) {
-                clearInterval(interval);
+            for (const block of events) {
+                let event = 'message';
+                let data = '';
+                block.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) event = line.slice(7);
+                    else if (line.startsWith('data: ')) data += line.slice(6);
+                });
+                if (data) onEvent(event, JSON.parse(data));
             }
-        }, 200);
+        }
     }
     
     hideUploadProgress() {
@@ -5,9 +5,11 @@ document.addEventListener('DOMContentLoaded', async () => {
     const resultsContainerEl = document.getElementById('results-container');
     const emptyStateEl = document.getElementById('empty-state');
     
-    // Global variables to store results and current filter
-    let globalResults = null;
+    // Results are paged from the server; only the current filter's pages are held here
+    const PAGE_SIZE = 100;
     let currentFilter = 'all';
+    let nextCursor = null;
+    let loadMoreBtn = null;
 
     // Get session ID from localStorage (set by homepage)
     const sessionId = localStorage.getItem('patternhive_session');
@@ -22,19 +24,14 @@ document.addEventListener('DOMContentLoaded', async () => {
     // Session ID element removed from display
 
     try {
-        // Fetch results from backend using session
-        const response = await fetch(`/api/export/json/${sessionId}`);
-        
-        if (!response.ok) {
-            throw new Error('Session not found or expired');
-        }
-        
-        const results = await response.json();
-        globalResults = results; // Store results globally
+        // Fetch stats and the first page of results from backend using session
+        const data = await fetchPage(null);
         
         // Display results
-        displayStats(results, filename, textInput);
-        displayResults(results);
+        displayStats(data.stats, filename, textInput);
+        setupLoadMore();
+        resetResults();
+        appendResults(data.page);
         setupFilters();
         setupExportButtons(sessionId);
         
@@ -43,20 +40,38 @@ document.addEventListener('DOMContentLoaded', async () => {
         showEmptyState();
     }
 
-    function displayStats(results, filename, textInput) {
+    async function fetchPage(cursor) {
+        const params = new URLSearchParams({ limit: PAGE_SIZE });
+        if (currentFilter !== 'all') {
+            params.set('type', currentFilter);
+        }
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        
+        const response = await fetch(`/api/results/${sessionId}?${params.toString()}`);
+        
+        if (!response.ok) {
+            throw new Error('Session not found or expired');
+        }
+        
+        return response.json();
+    }
+
+    function displayStats(stats, filename, textInput) {
         // Display stats grid with clean minimal styling
         statsGridEl.innerHTML = `
             <div class="data-card text-center floating">
                 <div class="text-3xl mb-4">📧</div>
-                <h3 class="text-xl font-orbitron">${results.emails ? results.emails.length : 0} Emails</h3>
+                <h3 class="text-xl font-orbitron">${stats.emails_found} Emails</h3>
             </div>
             <div class="data-card text-center floating" style="animation-delay: 1s;">
                 <div class="text-3xl mb-4">📞</div>
-                <h3 class="text-xl font-orbitron">${results.phones ? results.phones.length : 0} Phone Numbers</h3>
+                <h3 class="text-xl font-orbitron">${stats.phones_found} Phone Numbers</h3>
             </div>
             <div class="data-card text-center floating" style="animation-delay: 2s;">
                 <div class="text-3xl mb-4">👤</div>
-                <h3 class="text-xl font-orbitron">${results.names ? results.names.length : 0} Names</h3>
+                <h3 class="text-xl font-orbitron">${stats.names_found} Names</h3>
             </div>
         `;
         
@@ -68,101 +83,90 @@ document.addEventListener('DOMContentLoaded', async () => {
         statsGridEl.parentNode.insertBefore(sourceElement, statsGridEl.nextSibling);
     }
 
-    function displayResults(results) {
-        let html = '';
-        
-        // Emails section
-        if (results.emails && results.emails.length > 0) {
-            html += `
-                <div class="results-section mb-8" data-type="emails">
-                    <h3 class="text-2xl font-orbitron mb-4 text-electric-blue">📧 Email Addresses</h3>
-                    <div class="grid gap-4">
+    const sectionTitles = {
+        emails: '📧 Email Addresses',
+        phones: '📞 Phone Numbers',
+        names: '👤 Full Names'
+    };
+
+    function resetResults() {
+        resultsContainerEl.innerHTML = '';
+        nextCursor = null;
+    }
+
+    function getSectionGrid(category) {
+        // Sections are created lazily as their first items arrive
+        let section = resultsContainerEl.querySelector(`.results-section[data-type="${category}"]`);
+        if (!section) {
+            section = document.createElement('div');
+            section.className = 'results-section mb-8';
+            section.dataset.type = category;
+            section.innerHTML = `
+                <h3 class="text-2xl font-orbitron mb-4 text-electric-blue">${sectionTitles[category]}</h3>
+                <div class="grid gap-4"></div>
             `;
-            
-            results.emails.forEach((email, index) => {
-                const emailValue = typeof email === 'object' ? email.email : email;
-                const domain = typeof email === 'object' ? email.domain : '';
-                const valid = typeof email === 'object' ? email.valid : true;
-                const validityText = valid ? 'Valid' : 'Invalid';
-                const validityClass = valid ? 'high' : 'low';
-                html += `
-                    <div class="bg-slate border border-translucent-blue rounded-lg p-4 hover:border-electric-blue transition-colors">
-                        <div class="flex justify-between items-center">
-                            <div>
-                                <span class="font-mono text-ice-white">${emailValue}</span>
-                                ${domain ? `<div class="text-xs text-cool-gray mt-1">Domain: ${domain}</div>` : ''}
-                            </div>
-                            <span class="text-xs px-2 py-1 rounded-full ${getConfidenceBadgeClass(validityClass)}">${validityText}</span>
+            resultsContainerEl.appendChild(section);
+        }
+        return section.querySelector('.grid');
+    }
+
+    function renderItem(item) {
+        if (item.category === 'emails') {
+            const validityText = item.valid ? 'Valid' : 'Invalid';
+            const validityClass = item.valid ? 'high' : 'low';
+            return `
+                <div class="bg-slate border border-translucent-blue rounded-lg p-4 hover:border-electric-blue transition-colors">
+                    <div class="flex justify-between items-center">
+                        <div>
+                            <span class="font-mono text-ice-white">${item.email}</span>
+                            ${item.domain ? `<div class="text-xs text-cool-gray mt-1">Domain: ${item.domain}</div>` : ''}
                         </div>
+                        <span class="text-xs px-2 py-1 rounded-full ${getConfidenceBadgeClass(validityClass)}">${validityText}</span>
                     </div>
-                `;
-            });
-            
-            html += `</div></div>`;
+                </div>
+            `;
         }
         
-        // Phones section
-        if (results.phones && results.phones.length > 0) {
-            html += `
-                <div class="results-section mb-8" data-type="phones">
-                    <h3 class="text-2xl font-orbitron mb-4 text-electric-blue">📞 Phone Numbers</h3>
-                    <div class="grid gap-4">
-            `;
-            
-            results.phones.forEach((phone, index) => {
-                const phoneValue = typeof phone === 'object' ? phone.formatted : phone;
-                const country = typeof phone === 'object' ? phone.country : '';
-                const valid = typeof phone === 'object' ? phone.valid : true;
-                const validityText = valid ? 'Valid' : 'Unverified';
-                const validityClass = valid ? 'high' : 'medium';
-                html += `
-                    <div class="bg-slate border border-translucent-blue rounded-lg p-4 hover:border-electric-blue transition-colors">
-                        <div class="flex justify-between items-center">
-                            <div>
-                                <span class="font-mono text-ice-white">${phoneValue}</span>
-                                ${country ? `<div class="text-xs text-cool-gray mt-1">Country: ${country}</div>` : ''}
-                            </div>
-                            <span class="text-xs px-2 py-1 rounded-full ${getConfidenceBadgeClass(validityClass)}">${validityText}</span>
+        if (item.category === 'phones') {
+            const validityText = item.valid ? 'Valid' : 'Unverified';
+            const validityClass = item.valid ? 'high' : 'medium';
+            return `
+                <div class="bg-slate border border-translucent-blue rounded-lg p-4 hover:border-electric-blue transition-colors">
+                    <div class="flex justify-between items-center">
+                        <div>
+                            <span class="font-mono text-ice-white">${item.formatted}</span>
+                            ${item.country ? `<div class="text-xs text-cool-gray mt-1">Country: ${item.country}</div>` : ''}
                         </div>
+                        <span class="text-xs px-2 py-1 rounded-full ${getConfidenceBadgeClass(validityClass)}">${validityText}</span>
                     </div>
-                `;
-            });
-            
-            html += `</div></div>`;
+                </div>
+            `;
         }
         
-        // Names section
-        if (results.names && results.names.length > 0) {
-            html += `
-                <div class="results-section mb-8" data-type="names">
-                    <h3 class="text-2xl font-orbitron mb-4 text-electric-blue">👤 Full Names</h3>
-                    <div class="grid gap-4">
-            `;
-            
-            results.names.forEach((name, index) => {
-                const nameValue = typeof name === 'object' ? name.name : name;
-                const confidence = typeof name === 'object' ? name.confidence : 0.5;
-                const nameType = typeof name === 'object' ? name.type : 'unknown';
-                const confidenceText = confidence >= 0.8 ? 'High' : confidence >= 0.5 ? 'Medium' : 'Low';
-                const confidenceClass = confidence >= 0.8 ? 'high' : confidence >= 0.5 ? 'medium' : 'low';
-                html += `
-                    <div class="bg-slate border border-translucent-blue rounded-lg p-4 hover:border-electric-blue transition-colors">
-                        <div class="flex justify-between items-center">
-                            <div>
-                                <span class="font-mono text-ice-white">${nameValue}</span>
-                                <div class="text-xs text-cool-gray mt-1">Type: ${nameType.replace('_', ' ')} | Confidence: ${(confidence * 100).toFixed(0)}%</div>
-                            </div>
-                            <span class="text-xs px-2 py-1 rounded-full ${getConfidenceBadgeClass(confidenceClass)}">${confidenceText}</span>
-                        </div>
+        const confidence = item.confidence;
+        const confidenceText = confidence >= 0.8 ? 'High' : confidence >= 0.5 ? 'Medium' : 'Low';
+        const confidenceClass = confidence >= 0.8 ? 'high' : confidence >= 0.5 ? 'medium' : 'low';
+        return `
+            <div class="bg-slate border border-translucent-blue rounded-lg p-4 hover:border-electric-blue transition-colors">
+                <div class="flex justify-between items-center">
+                    <div>
+                        <span class="font-mono text-ice-white">${item.name}</span>
+                        <div class="text-xs text-cool-gray mt-1">Type: ${item.type.replace('_', ' ')} | Confidence: ${(confidence * 100).toFixed(0)}%</div>
                     </div>
-                `;
-            });
-            
-            html += `</div></div>`;
-        }
+                    <span class="text-xs px-2 py-1 rounded-full ${getConfidenceBadgeClass(confidenceClass)}">${confidenceText}</span>
+                </div>
+            </div>
+        `;
+    }
+
+    function appendResults(page) {
+        page.items.forEach(item => {
+            getSectionGrid(item.category).insertAdjacentHTML('beforeend', renderItem(item));
+        });
         
-        if (html === '') {
-            html = `
+        // An empty page with nothing already rendered means no matches at all
+        if (page.items.length === 0 && !resultsContainerEl.querySelector('.results-section')) {
+            resultsContainerEl.innerHTML = `
                 <div class="text-center py-20">
                     <div class="text-6xl mb-4">🔍</div>
                     <h3 class="text-2xl font-orbitron mb-2">No Data Extracted</h3>
@@ -171,7 +175,28 @@ document.addEventListener('DOMContentLoaded', async () => {
             `;
         }
         
-        resultsContainerEl.innerHTML = html;
+        nextCursor = page.next_cursor;
+        loadMoreBtn.style.display = nextCursor ? 'inline-block' : 'none';
+    }
+
+    function setupLoadMore() {
+        const wrapper = document.createElement('div');
+        wrapper.className = 'text-center mb-8';
+        wrapper.innerHTML = `<button id="load-more" class="export-btn">Load More</button>`;
+        resultsContainerEl.parentNode.insertBefore(wrapper, resultsContainerEl.nextSibling);
+        
+        loadMoreBtn = wrapper.querySelector('#load-more');
+        loadMoreBtn.addEventListener('click', async () => {
+            loadMoreBtn.disabled = true;
+            try {
+                const data = await fetchPage(nextCursor);
+                appendResults(data.page);
+            } catch (error) {
+                console.error('Error loading more results:', error);
+            } finally {
+                loadMoreBtn.disabled = false;
+            }
+        });
     }
 
     function getConfidenceBadgeClass(confidence) {
@@ -189,45 +214,25 @@ document.addEventListener('DOMContentLoaded', async () => {
         }
     }
 
-    function getFilteredData(results, filter) {
-        if (filter === 'all') {
-            return results;
-        }
-        
-        // Return only the selected data type
-        const filteredResults = {};
-        if (filter === 'emails' && results.emails) {
-            filteredResults.emails = results.emails;
-        } else if (filter === 'phones' && results.phones) {
-            filteredResults.phones = results.phones;
-        } else if (filter === 'names' && results.names) {
-            filteredResults.names = results.names;
-        }
-        
-        return filteredResults;
-    }
-
     function setupFilters() {
         const filterButtons = document.querySelectorAll('.filter-btn');
-        const resultsSections = document.querySelectorAll('.results-section');
         
         filterButtons.forEach(btn => {
-            btn.addEventListener('click', () => {
+            btn.addEventListener('click', async () => {
                 // Update active button
                 filterButtons.forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
                 
-                const filter = btn.dataset.filter;
-                currentFilter = filter; // Update global filter state
+                currentFilter = btn.dataset.filter; // Update global filter state
                 
-                // Show/hide sections based on filter
-                resultsSections.forEach(section => {
-                    if (filter === 'all' || section.dataset.type === filter) {
-                        section.style.display = 'block';
-                    } else {
-                        section.style.display = 'none';
-                    }
-                });
+                // Re-query the server so only the selected type is paged in
+                try {
+                    const data = await fetchPage(null);
+                    resetResults();
+                    appendResults(data.page);
+                } catch (error) {
+                    console.error('Error filtering results:', error);
+                }
             });
         });
     }
@@ -261,103 +266,10 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
 
     function exportFilteredData(format, sessionId) {
-        if (!globalResults) {
-            console.error('No results available for export');
-            return;
-        }
-
-        const filteredData = getFilteredData(globalResults, currentFilter);
-        
-        if (format === 'csv') {
-            exportAsCSV(filteredData);
-        } else if (format === 'json') {
-            exportAsJSON(filteredData);
-        }
-    }
-
-    function exportAsCSV(data) {
-        let csvContent = '';
-        const filename = `patternhive_${currentFilter}_${new Date().toISOString().split('T')[0]}.csv`;
-        
-        // CSV Headers and data based on current filter
-        if (currentFilter === 'all') {
-            // Export all data types
-            csvContent = 'Type,Value,Additional Info\n';
-            
-            if (data.emails) {
-                data.emails.forEach(email => {
-                    const emailValue = typeof email === 'object' ? email.email : email;
-                    const domain = typeof email === 'object' ? email.domain : '';
-                    const valid = typeof email === 'object' ? email.valid : true;
-                    csvContent += `Email,"${emailValue}","Domain: ${domain}, Valid: ${valid}"\n`;
-                });
-            }
-            
-            if (data.phones) {
-                data.phones.forEach(phone => {
-                    const phoneValue = typeof phone === 'object' ? phone.formatted : phone;
-                    const country = typeof phone === 'object' ? phone.country : '';
-                    const valid = typeof phone === 'object' ? phone.valid : true;
-                    csvContent += `Phone,"${phoneValue}","Country: ${country}, Valid: ${valid}"\n`;
-                });
-            }
-            
-            if (data.names) {
-                data.names.forEach(name => {
-                    const nameValue = typeof name === 'object' ? name.name : name;
-                    const confidence = typeof name === 'object' ? name.confidence : 0.5;
-                    const nameType = typeof name === 'object' ? name.type : 'unknown';
-                    csvContent += `Name,"${nameValue}","Type: ${nameType}, Confidence: ${(confidence * 100).toFixed(0)}%"\n`;
-                });
-            }
-        } else if (currentFilter === 'emails' && data.emails) {
-            csvContent = 'Email,Domain,Valid\n';
-            data.emails.forEach(email => {
-                const emailValue = typeof email === 'object' ? email.email : email;
-                const domain = typeof email === 'object' ? email.domain : '';
-                const valid = typeof email === 'object' ? email.valid : true;
-                csvContent += `"${emailValue}","${domain}","${valid}"\n`;
-            });
-        } else if (currentFilter === 'phones' && data.phones) {
-            csvContent = 'Phone Number,Country,Valid\n';
-            data.phones.forEach(phone => {
-                const phoneValue = typeof phone === 'object' ? phone.formatted : phone;
-                const country = typeof phone === 'object' ? phone.country : '';
-                const valid = typeof phone === 'object' ? phone.valid : true;
-                csvContent += `"${phoneValue}","${country}","${valid}"\n`;
-            });
-        } else if (currentFilter === 'names' && data.names) {
-            csvContent = 'Name,Type,Confidence\n';
-            data.names.forEach(name => {
-                const nameValue = typeof name === 'object' ? name.name : name;
-                const confidence = typeof name === 'object' ? name.confidence : 0.5;
-                const nameType = typeof name === 'object' ? name.type : 'unknown';
-                csvContent += `"${nameValue}","${nameType}","${(confidence * 100).toFixed(0)}%"\n`;
-            });
-        }
-        
-        // Create and trigger download
-        const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-        const link = document.createElement('a');
-        const url = URL.createObjectURL(blob);
-        link.setAttribute('href', url);
-        link.setAttribute('download', filename);
-        link.style.visibility = 'hidden';
-        document.body.appendChild(link);
-        link.click();
-        document.body.removeChild(link);
-    }
-
-    function exportAsJSON(data) {
-        const filename = `patternhive_${currentFilter}_${new Date().toISOString().split('T')[0]}.json`;
-        const jsonContent = JSON.stringify(data, null, 2);
-        
-        // Create and trigger download
-        const blob = new Blob([jsonContent], { type: 'application/json;charset=utf-8;' });
+        // Exports are generated server-side since only loaded pages are held here
+        const query = currentFilter === 'all' ? '' : `?type=${currentFilter}`;
         const link = document.createElement('a');
-        const url = URL.createObjectURL(blob);
-        link.setAttribute('href', url);
-        link.setAttribute('download', filename);
+        link.setAttribute('href', `/api/export/${format}/${sessionId}${query}`);
         link.style.visibility = 'hidden';
         document.body.appendChild(link);
         link.click();
@@ -0,0 +1,100 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class Overloaded(Exception):
+    """Raised when an endpoint class is already running its maximum concurrent requests"""
+
+    def __init__(self, endpoint_class: str, retry_after: int):
+        super().__init__(f"Server busy processing {endpoint_class} requests")
+        self.endpoint_class = endpoint_class
+        self.retry_after = retry_after
+
+
+class BudgetExceeded(Exception):
+    """Raised when a request uses more than its CPU-time or memory budget"""
+
+    def __init__(self, budget: str, limit: float, used: float):
+        # str() keeps every digit needed to tell the two values apart
+        super().__init__(f"Request exceeded its {budget} budget ({used} > {limit})")
+        self.budget = budget
+        self.limit = limit
+        self.used = used
+
+
+class AdmissionController:
+    """Per-endpoint-class concurrency limits that shed load instead of queueing"""
+
+    def __init__(self, limits: Dict[str, int], retry_after: Dict[str, int]):
+        self.limits = dict(limits)
+        self.retry_after = dict(retry_after)
+        self._slots = {name: threading.BoundedSemaphore(limit) for name, limit in limits.items()}
+
+    def try_acquire(self, endpoint_class: str):
+        """Take a slot without waiting, raising Overloaded when none are free"""
+        if not self._slots[endpoint_class].acquire(blocking=False):
+            raise Overloaded(endpoint_class, self.retry_after.get(endpoint_class, 1))
+
+    def release(self, endpoint_class: str):
+        """Return a slot taken by try_acquire"""
+        self._slots[endpoint_class].release()
+
+    @contextmanager
+    def admit(self, endpoint_class: str):
+        """Hold a slot for the duration of a request"""
+        self.try_acquire(endpoint_class)
+        try:
+            yield
+        finally:
+            self.release(endpoint_class)
+
+
+_active = threading.local()
+
+
+class ResourceBudget:
+    """CPU-time and memory limits for the request running on the current thread.
+
+    CPU time is the thread's own CPU clock, so time spent waiting on I/O or
+    other threads is not charged. Memory is not measured directly: callers
+    charge the bytes they hand to a parser (the raw upload, the decompressed
+    size of archive parts) and the text they get back, which bounds the input
+    parsers work on but not their own overhead.
+    """
+
+    def __init__(self, cpu_seconds: Optional[float] = None, memory_bytes: Optional[int] = None):
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+        self.memory_used = 0
+        self._start = None
+        self._previous = None
+
+    def __enter__(self):
+        self._start = time.thread_time()
+        self._previous = getattr(_active, 'budget', None)
+        _active.budget = self
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.budget = self._previous
+        return False
+
+    def check(self, nbytes: int = 0):
+        """Charge bytes against the memory budget and raise if any limit is exceeded"""
+        self.memory_used += nbytes
+        if self.memory_bytes is not None and self.memory_used > self.memory_bytes:
+            raise BudgetExceeded('memory', self.memory_bytes, self.memory_used)
+
+        if self.cpu_seconds is not None:
+            used = time.thread_time() - self._start
+            if used > self.cpu_seconds:
+                raise BudgetExceeded('cpu_time', self.cpu_seconds, used)
+
+
+def check_budget(nbytes: int = 0):
+    """Checkpoint for long-running loops; a no-op when no budget is active"""
+    budget = getattr(_active, 'budget', None)
+    if budget is not None:
+        budget.check(nbytes)
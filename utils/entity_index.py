@@ -0,0 +1,214 @@
+import re
+import csv
+import io
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import phonenumbers
+from phonenumbers import NumberParseException
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL UNIQUE,
+    source TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    document_count INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (kind, value)
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    entity_id INTEGER NOT NULL,
+    document_id INTEGER NOT NULL,
+    PRIMARY KEY (entity_id, document_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS mentions_by_document ON mentions (document_id);
+CREATE TRIGGER IF NOT EXISTS count_mention AFTER INSERT ON mentions
+BEGIN
+    UPDATE entities SET document_count = document_count + 1 WHERE id = NEW.entity_id;
+END;
+"""
+
+KINDS = ('emails', 'phones', 'names')
+EXPORT_BATCH_SIZE = 5000
+
+
+class EntityIndex:
+    """Persistent SQLite index of normalized entities across all processed documents"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            # WAL lets lookups and exports read while another request writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def normalize(self, kind: str, value: str, country: Optional[str] = None) -> Optional[str]:
+        """Normalize an entity value so repeated mentions share one row.
+
+        `country` is the region used to read phone numbers without a country code.
+        """
+        if not value:
+            return None
+
+        if kind == 'emails':
+            return value.strip().lower()
+
+        if kind == 'phones':
+            try:
+                parsed = phonenumbers.parse(value, (country or 'US').upper())
+                if phonenumbers.is_valid_number(parsed):
+                    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+            except NumberParseException:
+                pass
+            return re.sub(r'[^\d+]', '', value) or None
+
+        if kind == 'names':
+            return re.sub(r'\s+', ' ', value).strip().lower() or None
+
+        return None
+
+    def _entities_from_results(self, results: Dict) -> List[tuple]:
+        """Collect the distinct normalized (kind, value) pairs in a result set"""
+        raw_fields = {'emails': 'email', 'phones': 'phone', 'names': 'name'}
+        entities = set()
+        for kind in KINDS:
+            for entry in results.get(kind, []):
+                value = self.normalize(kind, entry.get(raw_fields[kind]), entry.get('country'))
+                if value:
+                    entities.add((kind, value))
+        return sorted(entities)
+
+    def add_document(self, session_id: str, results: Dict, source: Optional[str] = None) -> bool:
+        """Record a document's entities; returns False if the index could not be updated"""
+        entities = self._entities_from_results(results)
+
+        try:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    'INSERT INTO documents (session_id, source, created_at) VALUES (?, ?, ?)',
+                    (session_id, source, datetime.now().isoformat())
+                )
+                document_id = cursor.lastrowid
+
+                conn.executemany(
+                    'INSERT OR IGNORE INTO entities (kind, value) VALUES (?, ?)',
+                    entities
+                )
+                conn.executemany(
+                    'INSERT OR IGNORE INTO mentions (entity_id, document_id) '
+                    'SELECT id, ? FROM entities WHERE kind = ? AND value = ?',
+                    [(document_id, kind, value) for kind, value in entities]
+                )
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Error updating entity index: {str(e)}")
+            return False
+
+    def lookup(self, kind: str, value: str, country: Optional[str] = None, limit: int = 100) -> Optional[Dict]:
+        """Find an entity and the (first `limit`) documents that mention it.
+
+        Documents are identified by their row id, which is stable across restarts;
+        `session_id` only resolves through the results API while that session is
+        still held in memory.
+        """
+        normalized = self.normalize(kind, value, country)
+        if not normalized:
+            return None
+
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT id, document_count FROM entities WHERE kind = ? AND value = ?',
+            (kind, normalized)
+        ).fetchone()
+        if row is None:
+            return None
+
+        entity_id, document_count = row
+        documents = conn.execute(
+            'SELECT d.id, d.session_id, d.source, d.created_at FROM mentions m '
+            'JOIN documents d ON d.id = m.document_id '
+            'WHERE m.entity_id = ? ORDER BY m.document_id LIMIT ?',
+            (entity_id, limit)
+        ).fetchall()
+
+        return {
+            'type': kind,
+            'value': normalized,
+            'document_count': document_count,
+            'documents': [
+                {'document_id': document_id, 'session_id': session_id, 'source': source, 'timestamp': created_at}
+                for document_id, session_id, source, created_at in documents
+            ]
+        }
+
+    def iter_entities(self, kind: Optional[str] = None) -> Iterator[tuple]:
+        """Yield deduplicated (kind, value, document_count) rows in batches"""
+        query = 'SELECT kind, value, document_count FROM entities'
+        params = ()
+        if kind:
+            query += ' WHERE kind = ?'
+            params = (kind,)
+        query += ' ORDER BY kind, value'
+
+        # A dedicated connection keeps the long-running read off the request's writer
+        conn = sqlite3.connect(self.path)
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+
+    def export_csv(self, kind: Optional[str] = None) -> Iterator[str]:
+        """Stream the deduplicated corpus as CSV"""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['Type', 'Value', 'Documents'])
+
+        for count, row in enumerate(self.iter_entities(kind), 1):
+            writer.writerow(row)
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+
+        yield output.getvalue()
+
+    def export_json(self, kind: Optional[str] = None) -> Iterator[str]:
+        """Stream the deduplicated corpus as a JSON array"""
+        chunk = ['[']
+        for count, (entity_kind, value, document_count) in enumerate(self.iter_entities(kind)):
+            chunk.append((',' if count else '') + json.dumps({
+                'type': entity_kind,
+                'value': value,
+                'document_count': document_count
+            }))
+            if len(chunk) >= EXPORT_BATCH_SIZE:
+                yield ''.join(chunk)
+                chunk = []
+
+        chunk.append(']')
+        yield ''.join(chunk)
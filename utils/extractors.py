@@ -1,15 +1,20 @@
 import re
 import csv
 import io
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from email_validator import validate_email, EmailNotValidError
 import phonenumbers
 from phonenumbers import NumberParseException
+from utils.gazetteer import NameGazetteer
+from utils.admission import check_budget
 
 class TextExtractor:
     """Core text extraction engine using regex patterns"""
     
-    def __init__(self):
+    def __init__(self, gazetteer: Optional[NameGazetteer] = None):
+        # Memory-mapped name lexicon; scoring falls back to heuristics without it
+        self.gazetteer = gazetteer if gazetteer is not None else NameGazetteer.load_default()
+        
         # Email regex pattern - comprehensive but not overly strict
         self.email_pattern = re.compile(
             r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
@@ -60,6 +65,7 @@ class TextExtractor:
         seen = set()
         
         for match in matches:
+            check_budget()
             email = match.lower().strip()
             if email not in seen:
                 seen.add(email)
@@ -87,6 +93,7 @@ class TextExtractor:
         for pattern in self.phone_patterns:
             matches = pattern.findall(text)
             for match in matches:
+                check_budget()
                 if isinstance(match, tuple):
                     # For grouped patterns, reconstruct the number
                     phone_raw = ''.join(match)
@@ -139,6 +146,7 @@ class TextExtractor:
         for pattern in self.name_patterns:
             matches = pattern.findall(text)
             for match in matches:
+                check_budget()
                 name = match.strip()
                 
                 # Clean up line breaks and extra whitespace
@@ -203,8 +211,39 @@ class TextExtractor:
         if name.isupper() or not any(c.isupper() for c in name):
             score -= 0.2
         
+        # Score by position against the lexicon: the first-name slot must hold a
+        # known first name, since surname lists include many ordinary words
+        # ("Thank You", "Customer Service"). Both parts must be known to stay
+        # at or above the 0.5 "medium" threshold; a known first name alone
+        # ("Will Call") ranks just below it, ahead of an unknown first name.
+        if self.gazetteer is not None:
+            first, last = self._split_name_parts(name)
+            known_first = bool(first) and self.gazetteer.is_first_name(first)
+            known_last = bool(last) and self.gazetteer.is_surname(last)
+            if not known_first:
+                score -= 0.7
+            elif not known_last:
+                score -= 0.55
+        
         return min(1.0, max(0.0, score))
     
+    def _split_name_parts(self, name: str) -> tuple:
+        """Split a name into (first, last) words, ignoring titles and initials"""
+        if ',' in name:
+            last, _, rest = name.partition(',')
+            words = rest.split() + [last.strip()]
+        else:
+            words = name.split()
+        
+        titles = {'dr', 'mr', 'ms', 'mrs', 'miss', 'prof', 'professor'}
+        words = [w.strip('.') for w in words if w.strip('.').lower() not in titles and len(w.strip('.')) > 1]
+        
+        if not words:
+            return None, None
+        if len(words) == 1:
+            return words[0], None
+        return words[0], words[-1]
+    
     def _classify_name_type(self, name: str) -> str:
         """Classify the type of name found"""
         if ',' in name:
@@ -226,6 +265,30 @@ class TextExtractor:
             'names': self.extract_names(text)
         }
     
+    def extract_new(self, text: str, seen: Dict[str, Set[str]]) -> Dict:
+        """Extract all data types, returning only entries not already in `seen`.
+
+        `seen` is updated in place, so it can be threaded through successive
+        chunks of one document to deduplicate across pages.
+        """
+        keys = {
+            'emails': lambda item: item['email'],
+            'phones': lambda item: re.sub(r'[^\d+]', '', item['phone']),
+            'names': lambda item: item['name'].lower()
+        }
+
+        new_results = {}
+        for data_type, items in self.extract_all(text).items():
+            seen_keys = seen.setdefault(data_type, set())
+            new_results[data_type] = []
+            for item in items:
+                key = keys[data_type](item)
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    new_results[data_type].append(item)
+
+        return new_results
+
     def to_csv(self, results: Dict) -> str:
         """Convert results to CSV format"""
         output = io.StringIO()
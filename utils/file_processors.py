@@ -1,11 +1,13 @@
 import io
 import csv
-from typing import Optional
+import zipfile
+from typing import Iterator, Optional, Tuple
 from werkzeug.datastructures import FileStorage
 import pdfplumber
 from docx import Document
 import openpyxl
 from utils.validators import InputValidator
+from utils.admission import BudgetExceeded, check_budget
 
 class FileProcessor:
     """File processing utilities for extracting text from various formats"""
@@ -23,6 +25,8 @@ class FileProcessor:
         filename = file.filename.lower()
         
         try:
+            self._charge_input(file)
+            
             if filename.endswith('.pdf'):
                 return self._extract_from_pdf(file)
             elif filename.endswith(('.docx', '.doc')):
@@ -33,27 +37,74 @@ class FileProcessor:
                 return self._extract_from_text(file)
             else:
                 return None
+        except BudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error processing file {filename}: {str(e)}")
             return None
     
+    def iter_chunks(self, file: FileStorage) -> Iterator[Tuple[str, int, int]]:
+        """Yield (text, chunk number, total chunks) as a file is read.
+        
+        PDFs are yielded page by page so callers can report progress; other
+        formats are small enough to be yielded as a single chunk.
+        """
+        if not self.validator.validate_file(file):
+            return
+        
+        if file.filename.lower().endswith('.pdf'):
+            self._charge_input(file)
+            yield from self._iter_pdf_pages(file)
+            return
+        
+        text = self.extract_text(file)
+        if text:
+            yield text, 1, 1
+    
+    def _charge_input(self, file: FileStorage):
+        """Charge the bytes a parser will load against the memory budget.
+        
+        DOCX and XLSX files are zip archives whose parts are inflated before
+        parsing, so their uncompressed sizes are charged instead of the upload's.
+        """
+        stream = file.stream
+        stream.seek(0, io.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        
+        try:
+            with zipfile.ZipFile(stream) as archive:
+                size = sum(info.file_size for info in archive.infolist())
+        except zipfile.BadZipFile:
+            pass
+        finally:
+            stream.seek(0)
+        
+        check_budget(size)
+    
+    def _iter_pdf_pages(self, file: FileStorage) -> Iterator[Tuple[str, int, int]]:
+        """Yield the text of each PDF page with its page number and page count"""
+        with pdfplumber.open(file.stream) as pdf:
+            # Limit number of pages to prevent memory issues
+            pages_to_process = min(len(pdf.pages), self.max_pages)
+            
+            for i in range(pages_to_process):
+                page = pdf.pages[i]
+                text = page.extract_text() or ''
+                check_budget(len(text))
+                yield text, i + 1, pages_to_process
+                # Release the page's parsed objects once its text is out
+                page.flush_cache()
+    
     def _extract_from_pdf(self, file: FileStorage) -> Optional[str]:
         """Extract text from PDF file"""
         try:
-            text_content = []
-            
-            with pdfplumber.open(file.stream) as pdf:
-                # Limit number of pages to prevent memory issues
-                pages_to_process = min(len(pdf.pages), self.max_pages)
-                
-                for i in range(pages_to_process):
-                    page = pdf.pages[i]
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
+            text_content = [text for text, _, _ in self._iter_pdf_pages(file) if text]
             
             return '\n'.join(text_content) if text_content else None
             
+        except BudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error extracting PDF: {str(e)}")
             return None
@@ -66,12 +117,14 @@ class FileProcessor:
             
             # Extract text from paragraphs
             for paragraph in doc.paragraphs:
+                check_budget(len(paragraph.text))
                 if paragraph.text.strip():
                     text_content.append(paragraph.text)
             
             # Extract text from tables
             for table in doc.tables:
                 for row in table.rows:
+                    check_budget()
                     row_text = []
                     for cell in row.cells:
                         if cell.text.strip():
@@ -81,6 +134,8 @@ class FileProcessor:
             
             return '\n'.join(text_content) if text_content else None
             
+        except BudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error extracting DOCX: {str(e)}")
             return None
@@ -105,6 +160,7 @@ class FileProcessor:
                     
                     # Filter out None values and convert to strings
                     row_values = [str(cell) for cell in row if cell is not None and str(cell).strip()]
+                    check_budget(sum(len(value) for value in row_values))
                     
                     if row_values:
                         text_content.append(' | '.join(row_values))
@@ -116,6 +172,8 @@ class FileProcessor:
             workbook.close()
             return '\n'.join(text_content) if text_content else None
             
+        except BudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error extracting Excel: {str(e)}")
             return None
@@ -131,6 +189,7 @@ class FileProcessor:
             for encoding in encodings:
                 try:
                     text = content.decode(encoding)
+                    check_budget(len(text))
                     
                     # If it's a CSV file, try to parse it properly
                     if file.filename.lower().endswith('.csv'):
@@ -144,6 +203,8 @@ class FileProcessor:
             # If all encodings fail, return None
             return None
             
+        except BudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error extracting text: {str(e)}")
             return None
@@ -162,6 +223,7 @@ class FileProcessor:
                 
                 # Filter out empty cells and join with separator
                 row_values = [cell.strip() for cell in row if cell.strip()]
+                check_budget()
                 if row_values:
                     text_content.append(' | '.join(row_values))
                 
@@ -169,6 +231,8 @@ class FileProcessor:
             
             return '\n'.join(text_content) if text_content else None
             
+        except BudgetExceeded:
+            raise
         except Exception as e:
             print(f"Error parsing CSV: {str(e)}")
             return csv_text  # Return original text if parsing fails
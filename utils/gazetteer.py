@@ -0,0 +1,166 @@
+import os
+import mmap
+import struct
+from typing import Dict, Iterable, Optional
+
+# Binary trie layout (all integers little-endian):
+#   header: magic (4 bytes) | version (uint32) | node count (uint32)
+#   nodes:  flags (uint8) | child count (uint8) | child count * (label uint8, offset uint32)
+# Children are sorted by label, the root node directly follows the header and
+# offsets are absolute, so a lookup walks the mapped bytes without decoding them.
+MAGIC = b'PHGZ'
+VERSION = 1
+HEADER = struct.Struct('<4sII')
+NODE = struct.Struct('<BB')
+EDGE = struct.Struct('<BI')
+
+FIRST_NAME = 0x01
+SURNAME = 0x02
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_GAZETTEER_PATH = os.path.join(DEFAULT_DATA_DIR, 'names.gaz')
+
+
+class NameGazetteer:
+    """Read-only, memory-mapped lexicon of first names and surnames"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            # ACCESS_READ maps the file's page cache, so every worker shares one copy
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, self.node_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported gazetteer file: {path}")
+
+    @classmethod
+    def load_default(cls) -> Optional['NameGazetteer']:
+        """Load the gazetteer from PATTERNHIVE_GAZETTEER or the bundled file"""
+        path = os.environ.get('PATTERNHIVE_GAZETTEER', DEFAULT_GAZETTEER_PATH)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            print(f"Error loading gazetteer {path}: {str(e)}")
+            return None
+
+    def _flags(self, word: str) -> int:
+        """Walk the trie for a word and return its flags (O(length of word))"""
+        data = self._map
+        offset = HEADER.size
+
+        for byte in word.lower().encode('utf-8'):
+            _, child_count = NODE.unpack_from(data, offset)
+            edge = offset + NODE.size
+            next_offset = None
+
+            for _ in range(child_count):
+                label, child = EDGE.unpack_from(data, edge)
+                if label == byte:
+                    next_offset = child
+                    break
+                if label > byte:
+                    break
+                edge += EDGE.size
+
+            if next_offset is None:
+                return 0
+            offset = next_offset
+
+        return data[offset]
+
+    def is_first_name(self, word: str) -> bool:
+        """Check whether a word is a known first name"""
+        return bool(self._flags(word) & FIRST_NAME)
+
+    def is_surname(self, word: str) -> bool:
+        """Check whether a word is a known surname"""
+        return bool(self._flags(word) & SURNAME)
+
+    def close(self):
+        """Release the memory map and file handle"""
+        self._map.close()
+        self._file.close()
+
+
+def _read_words(lines: Iterable[str]) -> set:
+    """Lower-cased words from a list file, skipping blanks and # comments"""
+    words = set()
+    for line in lines:
+        word = line.strip().lower()
+        if word and not word.startswith('#'):
+            words.add(word)
+    return words
+
+
+def build_gazetteer(first_names: Iterable[str], surnames: Iterable[str], output_path: str,
+                    stopwords: Iterable[str] = ()) -> int:
+    """Compile name lists into the binary trie format, returning the node count.
+
+    Words in `stopwords` are left out of both lists.
+    """
+    root: Dict = {}
+    excluded = _read_words(stopwords)
+
+    def insert(word: str, flag: int):
+        node = root
+        for byte in word.encode('utf-8'):
+            node = node.setdefault(byte, {})
+        node[None] = node.get(None, 0) | flag
+
+    for word in _read_words(first_names) - excluded:
+        insert(word, FIRST_NAME)
+
+    for word in _read_words(surnames) - excluded:
+        insert(word, SURNAME)
+
+    # Assign offsets breadth-first so the root sits right after the header
+    order = [root]
+    offsets = {}
+    position = HEADER.size
+    index = 0
+    while index < len(order):
+        node = order[index]
+        index += 1
+        offsets[id(node)] = position
+        labels = sorted(label for label in node if label is not None)
+        position += NODE.size + EDGE.size * len(labels)
+        order.extend(node[label] for label in labels)
+
+    output = bytearray(HEADER.pack(MAGIC, VERSION, len(order)))
+    for node in order:
+        labels = sorted(label for label in node if label is not None)
+        output += NODE.pack(node.get(None, 0), len(labels))
+        for label in labels:
+            output += EDGE.pack(label, offsets[id(node[label])])
+
+    with open(output_path, 'wb') as f:
+        f.write(output)
+
+    return len(order)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build the PatternHive name gazetteer')
+    parser.add_argument('--first-names', default=os.path.join(DEFAULT_DATA_DIR, 'first_names.txt'))
+    parser.add_argument('--surnames', default=os.path.join(DEFAULT_DATA_DIR, 'surnames.txt'))
+    parser.add_argument('--stopwords', default=os.path.join(DEFAULT_DATA_DIR, 'stopwords.txt'))
+    parser.add_argument('--output', default=DEFAULT_GAZETTEER_PATH)
+    args = parser.parse_args()
+
+    with open(args.first_names, encoding='utf-8') as first_file, \
+            open(args.surnames, encoding='utf-8') as surname_file, \
+            open(args.stopwords, encoding='utf-8') as stopword_file:
+        nodes = build_gazetteer(first_file, surname_file, args.output, stopword_file)
+
+    print(f"Wrote {nodes} nodes to {args.output}")
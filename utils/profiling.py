@@ -0,0 +1,118 @@
+import hmac
+import uuid
+import marshal
+import cProfile
+import threading
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+# tracemalloc and the profiling hooks are process-wide, so only one capture may run at a time
+_capture_lock = threading.Lock()
+
+
+class RequestProfiler:
+    """Opt-in cProfile and tracemalloc capture for individual requests.
+
+    Profiling is disabled unless an admin token is configured, and a request
+    must present that token to be profiled, so ordinary requests only pay for
+    one attribute check.
+    """
+
+    def __init__(self, admin_token: Optional[str] = None, max_profiles: int = 20, traceback_depth: int = 10):
+        self.admin_token = admin_token
+        self.max_profiles = max_profiles
+        self.traceback_depth = traceback_depth
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.admin_token)
+
+    def is_admin(self, token: Optional[str]) -> bool:
+        """Check a presented token against the configured admin token"""
+        if not self.enabled or not token:
+            return False
+        # Compare bytes: compare_digest rejects non-ASCII str, and headers may be any latin-1 text
+        return hmac.compare_digest(
+            token.encode('utf-8', 'surrogateescape'),
+            self.admin_token.encode('utf-8', 'surrogateescape')
+        )
+
+    @contextmanager
+    def capture(self, endpoint: str):
+        """Profile the enclosed block and store the result, yielding its profile id.
+
+        Yields None without profiling when another capture is already running.
+        """
+        if not _capture_lock.acquire(blocking=False):
+            yield None
+            return
+
+        try:
+            profile_id = str(uuid.uuid4())
+            profiler = cProfile.Profile()
+
+            # Leave tracemalloc running if something outside the profiler started it
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start(self.traceback_depth)
+            baseline = tracemalloc.take_snapshot()
+
+            profiler.enable()
+            try:
+                yield profile_id
+            finally:
+                profiler.disable()
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                if started_tracing:
+                    tracemalloc.stop()
+
+                profiler.create_stats()
+                self._store(profile_id, {
+                    'endpoint': endpoint,
+                    'timestamp': datetime.now().isoformat(),
+                    # Same bytes Profile.dump_stats writes, so pstats, snakeviz and
+                    # flamegraph converters can load the download directly
+                    'pstats': marshal.dumps(profiler.stats),
+                    'allocations': self._format_allocations(snapshot, baseline, peak)
+                })
+        finally:
+            _capture_lock.release()
+
+    def _format_allocations(self, snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot,
+                            peak: int, limit: int = 30) -> str:
+        """Summarize memory allocated during the request by source line"""
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ]
+        differences = snapshot.filter_traces(filters).compare_to(baseline.filter_traces(filters), 'lineno')
+
+        lines = [f"Peak traced memory: {peak / 1024:.1f} KiB", f"Top {limit} allocation sites:"]
+        for stat in differences[:limit]:
+            lines.append(str(stat))
+        return '\n'.join(lines) + '\n'
+
+    def _store(self, profile_id: str, profile: Dict):
+        """Keep the most recent profiles, evicting the oldest"""
+        with self._lock:
+            self._profiles[profile_id] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list_profiles(self) -> list:
+        """Metadata for stored profiles, newest first"""
+        with self._lock:
+            return [
+                {'profile_id': profile_id, 'endpoint': profile['endpoint'], 'timestamp': profile['timestamp']}
+                for profile_id, profile in reversed(self._profiles.items())
+            ]
@@ -0,0 +1,117 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+CATEGORIES = ('emails', 'phones', 'names')
+
+
+class ResultIndex:
+    """Per-session secondary indexes for paging and filtering extraction results"""
+
+    def __init__(self, results: Dict):
+        # References to the session's result entries (no copies); an entry's
+        # position in this list doubles as its id and cursor
+        self.entries = []
+        self.categories = []
+        for category in CATEGORIES:
+            for entry in results.get(category, []):
+                self.entries.append(entry)
+                self.categories.append(category)
+
+        # Categories are stored contiguously, so each is a range of positions
+        self.by_category = {}
+        for category in CATEGORIES:
+            first = self.categories.index(category) if category in self.categories else 0
+            self.by_category[category] = range(first, first + self.categories.count(category))
+
+        # Names arrive sorted by descending confidence; keep the negated scores so a
+        # minimum confidence is one bisect into the names range
+        names = self.by_category['names']
+        self._negated_confidences = [-self.entries[pos].get('confidence', 0) for pos in names]
+        self._confidence_sorted = self._negated_confidences == sorted(self._negated_confidences)
+
+        # Each index maps a value to the ascending list of positions holding it
+        self.by_domain = self._build_index(lambda pos: self._normalized(pos, 'domain', str.lower))
+        self.by_country = self._build_index(lambda pos: self._normalized(pos, 'country', str.upper))
+        self.by_valid = self._build_index(lambda pos: self.entries[pos].get('valid'))
+
+    def _normalized(self, pos: int, field: str, normalize) -> Optional[str]:
+        value = self.entries[pos].get(field)
+        return normalize(value) if value else None
+
+    def _build_index(self, key) -> Dict:
+        """Group positions by the value returned by `key`"""
+        index = {}
+        for pos in range(len(self.entries)):
+            value = key(pos)
+            if value is not None:
+                index.setdefault(value, []).append(pos)
+        return index
+
+    def _plan(self, filters: Dict):
+        """Pick the most selective index to walk and the checks to apply per entry"""
+        candidates = [range(len(self.entries))]
+        checks = []
+
+        category = filters.get('category')
+        if filters.get('min_confidence') is not None:
+            # Only names carry a confidence score
+            if category and category != 'names':
+                return [], []
+            category = 'names'
+            threshold = filters['min_confidence']
+            names = self.by_category['names']
+            if self._confidence_sorted:
+                cut = bisect_right(self._negated_confidences, -threshold)
+                candidates.append(range(names.start, names.start + cut))
+            checks.append(lambda pos: self.entries[pos].get('confidence', 0) >= threshold)
+
+        if category:
+            candidates.append(self.by_category.get(category, []))
+            checks.append(lambda pos: self.categories[pos] == category)
+        if filters.get('domain'):
+            domain = filters['domain'].lower()
+            candidates.append(self.by_domain.get(domain, []))
+            checks.append(lambda pos: self._normalized(pos, 'domain', str.lower) == domain)
+        if filters.get('country'):
+            country = filters['country'].upper()
+            candidates.append(self.by_country.get(country, []))
+            checks.append(lambda pos: self._normalized(pos, 'country', str.upper) == country)
+        if filters.get('valid') is not None:
+            valid = filters['valid']
+            candidates.append(self.by_valid.get(valid, []))
+            checks.append(lambda pos: self.entries[pos].get('valid') == valid)
+
+        return min(candidates, key=len), checks
+
+    def item(self, pos: int) -> Dict:
+        """An entry as returned by the API, tagged with its id and category"""
+        return dict(self.entries[pos], id=pos, category=self.categories[pos])
+
+    def query(self, filters: Optional[Dict] = None, cursor: Optional[int] = None, limit: int = 50) -> Dict:
+        """Return one page of items matching all filters, starting after the cursor"""
+        driver, checks = self._plan(filters or {})
+
+        # Seek into the driving index and stop as soon as one extra match proves there is more
+        start = bisect_right(driver, cursor) if cursor is not None else 0
+        page: List[int] = []
+        has_more = False
+        for i in range(start, len(driver)):
+            pos = driver[i]
+            if all(check(pos) for check in checks):
+                if len(page) == limit:
+                    has_more = True
+                    break
+                page.append(pos)
+
+        return {
+            'items': [self.item(pos) for pos in page],
+            'next_cursor': str(page[-1]) if has_more else None
+        }
+
+    def stats(self) -> Dict:
+        """Summary counts for the indexed results"""
+        return {
+            'emails_found': len(self.by_category.get('emails', [])),
+            'phones_found': len(self.by_category.get('phones', [])),
+            'names_found': len(self.by_category.get('names', []))
+        }